@@ -0,0 +1 @@
+# Puts the project root on sys.path so tests can import app, routes and services
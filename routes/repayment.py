@@ -1,40 +1,125 @@
-from flask import Blueprint, request, jsonify
-import pandas as pd
-import os
-from datetime import datetime
+from flask import Blueprint, Response, request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
+import hashlib
+import logging
+import threading
+import traceback
+from collections import OrderedDict
+import io
+import orjson
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from services.schedule_builder import ScheduleInputError, compute_schedule
+
+logger = logging.getLogger(__name__)
 
 repayment_bp = Blueprint('repayment', __name__)
 
-@repayment_bp.route('/generate-schedule', methods=['POST'])
-def generate_schedule():
-    if 'file' not in request.files:
-        return jsonify({'error': 'No file provided'}), 400
-    
-    file = request.files['file']
-    if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
+# Computed results kept for repeated uploads of the same file, keyed by content hash.
+# Entries are shared between requests, so response code must treat them as read-only
+SCHEDULE_CACHE_SIZE = 64
+_schedule_cache = OrderedDict()
+_schedule_cache_lock = threading.Lock()
+
+# Schedule data can also be returned row by row or columnar, chosen by Accept
+NDJSON_MIMETYPE = 'application/x-ndjson'
+ARROW_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+def _ndjson_lines(schedule_df, metrics):
+    """Yield the metrics, then one schedule row per line"""
+    yield orjson.dumps({"metrics": metrics}) + b'\n'
+    for row in schedule_df.to_dict(orient='records'):
+        yield orjson.dumps(row) + b'\n'
+
+def _arrow_stream(schedule_df, metrics):
+    """Serialize the schedule as an Arrow IPC stream, with the metrics in the schema metadata"""
+    table = pa.Table.from_pandas(schedule_df, preserve_index=False)
+    table = table.replace_schema_metadata({b'metrics': orjson.dumps(metrics)})
+    sink = io.BytesIO()
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+def _cached_schedule(raw):
+    """
+    Compute the schedule for an upload, reusing the result for byte-identical uploads.
     
-    if not file.filename.endswith('.csv'):
-        return jsonify({'error': 'File must be a CSV'}), 400
+    The returned metrics dict and schedule frame are the cached objects themselves,
+    not copies; callers must not modify them. Input errors are not cached.
+    """
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    with _schedule_cache_lock:
+        if key in _schedule_cache:
+            logger.info(f"Schedule cache hit: {key}")
+            _schedule_cache.move_to_end(key)
+            return _schedule_cache[key]
     
+    result = compute_schedule(raw)
+    with _schedule_cache_lock:
+        _schedule_cache[key] = result
+        if len(_schedule_cache) > SCHEDULE_CACHE_SIZE:
+            _schedule_cache.popitem(last=False)
+    return result
+
+@repayment_bp.route('/generate-schedule', methods=['POST'])
+def generate_schedule():
     try:
-        # Read and parse the CSV file
-        df = pd.read_csv(file)
+        logger.info("Received request to generate schedule")
+        logger.info(f"Request files: {request.files}")
+        
+        if 'file' not in request.files:
+            logger.error("No file provided in request")
+            return jsonify({"error": "No file provided"}), 400
+            
+        file = request.files['file']
+        logger.info(f"Received file: {file.filename}")
+        
+        if file.filename == '':
+            logger.error("No file selected")
+            return jsonify({"error": "No file selected"}), 400
+            
+        if not file.filename.endswith('.csv'):
+            logger.error("File must be a CSV")
+            return jsonify({"error": "File must be a CSV"}), 400
+            
+        # Read the upload once; identical uploads are answered from the cache
+        try:
+            metrics, schedule_df = _cached_schedule(file.read())
+        except ScheduleInputError as e:
+            logger.error(str(e))
+            return jsonify({"error": str(e)}), 400
+        
+        if schedule_df is None:
+            return jsonify({
+                "metrics": metrics,
+                "data": [],
+                "streamed": True
+            })
         
-        # Validate required columns
-        required_columns = ['month', 'income']
-        if not all(col in df.columns for col in required_columns):
-            return jsonify({'error': 'CSV must contain "month" and "income" columns'}), 400
+        logger.info("Successfully generated schedule")
+        response_format = request.accept_mimetypes.best_match(
+            ['application/json', NDJSON_MIMETYPE, ARROW_MIMETYPE], default='application/json'
+        )
+        if response_format == NDJSON_MIMETYPE:
+            return Response(_ndjson_lines(schedule_df, metrics), mimetype=NDJSON_MIMETYPE)
+        if response_format == ARROW_MIMETYPE:
+            return Response(_arrow_stream(schedule_df, metrics), mimetype=ARROW_MIMETYPE)
         
-        # TODO: Implement schedule generation logic
-        # This is a placeholder response
         schedule = {
-            'status': 'success',
-            'message': 'Schedule generation endpoint is ready',
-            'data': df.to_dict(orient='records')
+            "metrics": metrics,
+            "data": schedule_df.to_dict(orient='records')
         }
-        
         return jsonify(schedule)
-    
+        
+    except RequestEntityTooLarge:
+        logger.error("Uploaded file is too large")
+        return jsonify({"error": "File is too large"}), 413
+        
     except Exception as e:
-        return jsonify({'error': str(e)}), 500 
\ No newline at end of file
+        logger.error(f"Error processing data: {str(e)}")
+        logger.error(f"Traceback: {traceback.format_exc()}")
+        return jsonify({
+            "error": "Internal server error",
+            "details": str(e),
+            "traceback": traceback.format_exc()
+        }), 500
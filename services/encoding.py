@@ -0,0 +1,37 @@
+import codecs
+import chardet
+
+# Bytes inspected when sniffing the encoding of an upload
+SAMPLE_SIZE = 64 * 1024
+
+# chardet guesses below this confidence are ignored
+MIN_CONFIDENCE = 0.5
+
+def detect_encoding(sample: bytes, fallback: str = 'cp1251') -> str:
+    """
+    Guess the text encoding of a file from a sample of its first bytes.
+
+    Args:
+        sample: Leading bytes of the file, typically SAMPLE_SIZE long
+        fallback: Encoding returned when no check gives a confident answer
+
+    Returns:
+        Name of the encoding to decode the whole file with
+    """
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    if sample.isascii():
+        return 'utf-8'
+
+    # The sample may end in the middle of a multi-byte character
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    detection = chardet.detect(sample)
+    if detection['encoding'] and detection['confidence'] >= MIN_CONFIDENCE:
+        return detection['encoding'].lower()
+    return fallback
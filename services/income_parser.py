@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import Dict, List
+from typing import Dict
 import numpy as np
 
 class IncomeParser:
@@ -32,8 +32,14 @@ class IncomeParser:
             }
             
             # Identify seasonal patterns
-            monthly_avg = df.groupby(df['month'].dt.month)['income'].mean()
-            seasonal_pattern = monthly_avg.to_dict()
+            month_numbers = df['month'].dt.month.to_numpy()
+            incomes = df['income'].to_numpy(dtype=np.float64)
+            valid = ~(np.isnan(month_numbers) | np.isnan(incomes))
+            months = month_numbers[valid].astype(np.int64)
+            counts = np.bincount(months, minlength=13)
+            sums = np.bincount(months, weights=incomes[valid], minlength=13)
+            means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+            seasonal_pattern = {month: float(means[month]) for month in range(1, 13) if counts[month]}
             
             return {
                 'raw_data': df.to_dict(orient='records'),
@@ -45,25 +51,27 @@ class IncomeParser:
             raise ValueError(f"Error parsing CSV file: {str(e)}")
     
     @staticmethod
-    def detect_seasons(data: List[Dict]) -> Dict:
+    def detect_seasons(monthly_avg: Dict[int, float]) -> Dict:
         """
         Detect high and low income seasons based on historical data.
         
         Args:
-            data: List of monthly income records
+            monthly_avg: Average income per calendar month, as returned in
+                parse_csv's 'seasonal_pattern'
             
         Returns:
             Dict containing season information
         """
-        df = pd.DataFrame(data)
-        monthly_avg = df.groupby(df['month'].dt.month)['income'].mean()
+        months = np.fromiter(monthly_avg.keys(), dtype=np.int64, count=len(monthly_avg))
+        averages = np.fromiter(monthly_avg.values(), dtype=np.float64, count=len(monthly_avg))
+        overall_avg = np.nanmean(averages)
         
         # Define seasons based on income patterns
-        high_season = monthly_avg[monthly_avg > monthly_avg.mean()].index.tolist()
-        low_season = monthly_avg[monthly_avg <= monthly_avg.mean()].index.tolist()
+        high_season = months[averages > overall_avg].tolist()
+        low_season = months[averages <= overall_avg].tolist()
         
         return {
             'high_season_months': high_season,
             'low_season_months': low_season,
-            'monthly_averages': monthly_avg.to_dict()
-        } 
\ No newline at end of file
+            'monthly_averages': monthly_avg
+        }
@@ -10,6 +10,23 @@ class PDFGenerator:
     def __init__(self, output_dir: str = 'generated_pdfs'):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        
+        # Styles don't change between documents, so build them once
+        self._styles = getSampleStyleSheet()
+        self._table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 14),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 12),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
     
     def generate_schedule_pdf(self, schedule: List[Dict], metrics: Dict) -> str:
         """
@@ -30,10 +47,9 @@ class PDFGenerator:
         # Create PDF document
         doc = SimpleDocTemplate(filepath, pagesize=letter)
         elements = []
-        styles = getSampleStyleSheet()
         
         # Add title
-        title = Paragraph("Repayment Schedule", styles['Title'])
+        title = Paragraph("Repayment Schedule", self._styles['Title'])
         elements.append(title)
         
         # Add metrics summary
@@ -45,35 +61,19 @@ class PDFGenerator:
         Completion Date: {metrics['completion_date']}
         Total Months: {metrics['total_months']}
         """
-        summary = Paragraph(metrics_text, styles['Normal'])
+        summary = Paragraph(metrics_text, self._styles['Normal'])
         elements.append(summary)
         
         # Create schedule table
-        table_data = [['Date', 'Payment', 'Remaining Balance', 'Season']]
-        for record in schedule:
-            table_data.append([
-                record['date'],
-                f"${record['payment']:,.2f}",
-                f"${record['remaining_balance']:,.2f}",
-                record['season'].capitalize()
-            ])
+        dates = [record['date'] for record in schedule]
+        payments = [f"${record['payment']:,.2f}" for record in schedule]
+        balances = [f"${record['remaining_balance']:,.2f}" for record in schedule]
+        seasons = [record['season'].title() for record in schedule]
+        table_data = [['Date', 'Payment', 'Remaining Balance', 'Season'], *zip(dates, payments, balances, seasons)]
         
         # Style the table
         table = Table(table_data)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 12),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(self._table_style)
         
         elements.append(table)
         
@@ -0,0 +1,309 @@
+import logging
+import io
+import re
+import numpy as np
+import pandas as pd
+from services.encoding import detect_encoding, SAMPLE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Uploads above this size are reduced chunk by chunk instead of loaded whole
+STREAMING_THRESHOLD = 5 * 1024 * 1024
+CHUNK_SIZE = 65536
+
+# Column types declared up front so pandas can skip type inference
+CSV_DTYPES = {'Month': str, 'Date': str}
+CURRENCY_COLUMNS = ['Total Income', 'Fixed Expenses']
+CURRENCY_DTYPES = {column: 'float64' for column in CURRENCY_COLUMNS}
+REQUIRED_COLUMNS = ['Month', 'Date', 'Total Income', 'Fixed Expenses']
+_CURRENCY_RE = re.compile(r'[^\d.-]')
+
+class ScheduleInputError(ValueError):
+    """Raised when an upload can't be turned into a schedule; the message is shown to the client"""
+
+def _text_or_none(value):
+    """Return a Month/Date cell as str, or None for a blank cell so it serializes as null"""
+    return value if isinstance(value, str) else None
+
+def read_income_csv(buffer, encoding='utf-8'):
+    """Read an income CSV, cleaning currency columns only if the C float parser rejects them"""
+    try:
+        return pd.read_csv(buffer, encoding=encoding, dtype={**CSV_DTYPES, **CURRENCY_DTYPES}, engine='c')
+    except UnicodeDecodeError:
+        raise
+    except ValueError as e:
+        logger.info(f"Fast CSV parse failed ({str(e)}), cleaning currency columns")
+        buffer.seek(0)
+        df = pd.read_csv(buffer, encoding=encoding, dtype=CSV_DTYPES, engine='c')
+        return clean_currency_columns(df)
+
+def clean_currency_columns(df):
+    """Parse text currency columns, stripping symbols and commas only from cells that aren't plain numbers"""
+    for column in CURRENCY_COLUMNS:
+        if column in df.columns and df[column].dtype == object:
+            values = pd.to_numeric(df[column], errors='coerce')
+            unparsed = values.isna() & df[column].notna()
+            if unparsed.any():
+                stripped = df.loc[unparsed, column].str.replace(_CURRENCY_RE, '', regex=True)
+                values[unparsed] = pd.to_numeric(stripped, errors='coerce')
+            df[column] = values
+    return df
+
+def streaming_metrics(chunks):
+    """Calculate schedule metrics from an iterable of CSV chunks without keeping the rows"""
+    columns = ['Total Income', 'Fixed Expenses', 'Available Money']
+    count = 0
+    means = np.zeros(3)
+    sq_diffs = np.zeros(3)  # Welford/Chan running sum of squared deviations
+    totals = np.zeros(3)
+    first = last = None
+    pct_sums = np.zeros(2)
+    pct_counts = np.zeros(2)
+    rate_sum = 0.0
+    rate_count = 0
+    best = (-np.inf, None)
+    worst = (np.inf, None)
+    completion_date = None
+    
+    for chunk in chunks:
+        if count == 0:
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in chunk.columns]
+            if missing_columns:
+                raise ScheduleInputError(f"Missing required columns: {', '.join(missing_columns)}")
+        if chunk.empty:
+            continue
+        
+        chunk = clean_currency_columns(chunk)
+        chunk[CURRENCY_COLUMNS] = chunk[CURRENCY_COLUMNS].fillna(0.0)
+        chunk['Available Money'] = chunk['Total Income'] - chunk['Fixed Expenses']
+        values = chunk[columns].to_numpy(dtype=np.float64)
+        
+        # Merge this chunk's mean and squared deviations into the running ones
+        chunk_count = len(values)
+        chunk_means = values.mean(axis=0)
+        chunk_sq_diffs = ((values - chunk_means) ** 2).sum(axis=0)
+        delta = chunk_means - means
+        combined = count + chunk_count
+        means += delta * chunk_count / combined
+        sq_diffs += chunk_sq_diffs + delta ** 2 * count * chunk_count / combined
+        count = combined
+        totals += values.sum(axis=0)
+        
+        # Month-over-month changes, carrying the previous chunk's last row
+        flows = values[:, :2]
+        previous = flows[:-1] if last is None else np.vstack([last, flows[:-1]])
+        current = flows[1:] if last is None else flows
+        with np.errstate(divide='ignore', invalid='ignore'):
+            changes = current / previous - 1
+            rates = values[:, 2] / values[:, 0] * 100
+        pct_sums += np.nansum(changes, axis=0)
+        pct_counts += (~np.isnan(changes)).sum(axis=0)
+        rate_sum += float(np.nansum(rates))
+        rate_count += int((~np.isnan(rates)).sum())
+        if first is None:
+            first = flows[0].copy()
+        last = flows[-1]
+        
+        available = values[:, 2]
+        imax, imin = int(available.argmax()), int(available.argmin())
+        if available[imax] > best[0]:
+            best = (available[imax], _text_or_none(chunk['Month'].iat[imax]))
+        if available[imin] < worst[0]:
+            worst = (available[imin], _text_or_none(chunk['Month'].iat[imin]))
+        completion_date = _text_or_none(chunk['Date'].iat[-1])
+    
+    if count == 0:
+        raise ScheduleInputError("CSV file contains no data rows")
+    
+    stds = np.sqrt(sq_diffs / (count - 1)) if count > 1 else np.zeros(3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = np.nan_to_num((last / first - 1) * 100, nan=0.0, posinf=np.inf, neginf=-np.inf)
+        trends = np.nan_to_num(pct_sums / pct_counts * 100, nan=0.0, posinf=np.inf, neginf=-np.inf)
+        savings_rate = totals[2] / totals[0] * 100
+    average_savings_rate = rate_sum / rate_count if rate_count else 0.0
+    
+    # Medians need the whole column, so they are not reported for streamed uploads
+    return {
+        "total_amount": float(totals[2]),
+        "average_payment": float(means[2]),
+        "min_payment": float(worst[0]),
+        "max_payment": float(best[0]),
+        "completion_date": completion_date,
+        "total_months": count,
+        "total_income": float(totals[0]),
+        "total_expenses": float(totals[1]),
+        "average_savings_rate": average_savings_rate if average_savings_rate == average_savings_rate else 0.0,
+        "trends": {
+            "income_trend": float(trends[0]),
+            "expense_trend": float(trends[1]),
+            "savings_rate": float(savings_rate) if savings_rate == savings_rate else 0.0
+        },
+        "monthly_stats": {
+            "income_stats": {"mean": float(means[0]), "median": None, "std": float(stds[0]), "growth": float(growth[0])},
+            "expense_stats": {"mean": float(means[1]), "median": None, "std": float(stds[1]), "growth": float(growth[1])},
+            "savings_stats": {"mean": float(means[2]), "median": None, "std": float(stds[2]),
+                              "best_month": best[1], "worst_month": worst[1]}
+        }
+    }
+
+def calculate_trends(df):
+    """Calculate trend analysis for income and expenses"""
+    trends = (df[['Total Income', 'Fixed Expenses']].pct_change().mean() * 100).fillna(0.0)
+    savings_rate = (df['Available Money'].sum() / df['Total Income'].sum()) * 100
+    
+    return {
+        "income_trend": float(trends['Total Income']),  # Monthly income growth rate
+        "expense_trend": float(trends['Fixed Expenses']),  # Monthly expense growth rate
+        "savings_rate": float(savings_rate) if savings_rate == savings_rate else 0.0,   # Overall savings rate
+    }
+
+def calculate_monthly_stats(df):
+    """Calculate monthly statistics"""
+    columns = ['Total Income', 'Fixed Expenses', 'Available Money']
+    stats = df[columns].agg(['mean', 'median', 'std']).fillna(0.0)
+    endpoints = df[columns].iloc[[0, -1]]
+    growth = (((endpoints.iloc[1] / endpoints.iloc[0]) - 1) * 100).fillna(0.0)
+    available = df['Available Money'].to_numpy()
+    months = df['Month'].to_numpy()
+    best_month, worst_month = months[int(available.argmax())], months[int(available.argmin())]
+    
+    return {
+        "income_stats": {
+            "mean": float(stats.at['mean', 'Total Income']),
+            "median": float(stats.at['median', 'Total Income']),
+            "std": float(stats.at['std', 'Total Income']),
+            "growth": float(growth['Total Income'])
+        },
+        "expense_stats": {
+            "mean": float(stats.at['mean', 'Fixed Expenses']),
+            "median": float(stats.at['median', 'Fixed Expenses']),
+            "std": float(stats.at['std', 'Fixed Expenses']),
+            "growth": float(growth['Fixed Expenses'])
+        },
+        "savings_stats": {
+            "mean": float(stats.at['mean', 'Available Money']),
+            "median": float(stats.at['median', 'Available Money']),
+            "std": float(stats.at['std', 'Available Money']),
+            "best_month": _text_or_none(best_month),
+            "worst_month": _text_or_none(worst_month)
+        }
+    }
+
+def _read_frame(raw, encoding):
+    """Read a whole upload, reporting anything but a decode error as bad input"""
+    try:
+        return read_income_csv(io.BytesIO(raw), encoding=encoding)
+    except UnicodeDecodeError:
+        raise
+    except Exception as e:
+        raise ScheduleInputError(f"Error reading CSV file: {str(e)}") from e
+
+def _read_chunks(raw, encoding):
+    """Yield an upload in chunks, reporting anything but a decode error as bad input"""
+    try:
+        reader = pd.read_csv(io.BytesIO(raw), encoding=encoding, dtype=CSV_DTYPES,
+                             chunksize=CHUNK_SIZE, engine='c')
+        for chunk in reader:
+            yield chunk
+    except UnicodeDecodeError:
+        raise
+    except Exception as e:
+        raise ScheduleInputError(f"Error reading CSV file: {str(e)}") from e
+
+def compute_schedule(raw):
+    """Parse an uploaded CSV and calculate its metrics and, for small uploads, the schedule frame"""
+    # Sniff the encoding from the head of the upload
+    detected = detect_encoding(raw[:SAMPLE_SIZE])
+    logger.info(f"Detected encoding: {detected}")
+    logger.info(f"File content preview: {raw[:200].decode(detected, errors='replace')}...")
+    
+    # Large uploads are only reduced to metrics, one chunk at a time
+    streaming = len(raw) > STREAMING_THRESHOLD
+    
+    # Fall back to common encodings only if the detected one fails. Read errors
+    # arrive as ScheduleInputError; anything else raised while reducing is a bug
+    encodings = [detected] + [enc for enc in ['utf-8', 'utf-8-sig', 'cp1251'] if enc != detected]
+    df = None
+    metrics = None
+    last_error = None
+    
+    for encoding in encodings:
+        try:
+            logger.info(f"Trying encoding: {encoding}")
+            if streaming:
+                metrics = streaming_metrics(_read_chunks(raw, encoding))
+            else:
+                df = _read_frame(raw, encoding)
+                logger.info(f"DataFrame columns: {df.columns.tolist()}")
+            logger.info(f"Successfully read CSV with encoding: {encoding}")
+            break
+        except UnicodeDecodeError as e:
+            last_error = str(e)
+            continue
+    
+    if df is None and metrics is None:
+        raise ScheduleInputError(f"Error reading CSV file: Failed to read CSV with any encoding. Last error: {last_error}")
+    
+    if streaming:
+        logger.info(f"Streamed {metrics['total_months']} rows; schedule data omitted")
+        return metrics, None
+        
+    # Validate required columns
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing_columns:
+        raise ScheduleInputError(f"Missing required columns: {', '.join(missing_columns)}")
+    if df.empty:
+        raise ScheduleInputError("CSV file contains no data rows")
+        
+    logger.info("Column validation passed")
+    logger.info(f"DataFrame head: \n{df.head()}")
+    
+    # Currency columns are already parsed to float by read_income_csv;
+    # zero out blanks once so the arithmetic below never sees NaN
+    df[CURRENCY_COLUMNS] = df[CURRENCY_COLUMNS].fillna(0.0)
+    logger.info(f"Total Income range: {df['Total Income'].min()} - {df['Total Income'].max()}")
+    logger.info(f"Fixed Expenses range: {df['Fixed Expenses'].min()} - {df['Fixed Expenses'].max()}")
+    
+    # Calculate available money for each month
+    df['Available Money'] = df['Total Income'] - df['Fixed Expenses']
+    df['Savings Rate'] = (df['Available Money'] / df['Total Income']) * 100
+    
+    # Calculate total available money
+    total_available = float(df['Available Money'].sum())
+    logger.info(f"Total available money: {total_available}")
+    
+    # Generate schedule data; the accumulating balance is a running sum
+    schedule_df = pd.DataFrame({
+        "date": df['Date'].where(df['Date'].notna(), None),
+        "payment": df['Available Money'],
+        "remaining_balance": df['Available Money'].cumsum(),
+        "savings_rate": df['Savings Rate']
+    }).astype({"payment": 'float64', "remaining_balance": 'float64', "savings_rate": 'float64'})
+    schedule_df['savings_rate'] = schedule_df['savings_rate'].fillna(0.0)
+    
+    # Calculate trends and statistics
+    trends = calculate_trends(df)
+    monthly_stats = calculate_monthly_stats(df)
+    
+    # Calculate metrics; only the savings rate can still be NaN here
+    average_savings_rate = df['Savings Rate'].mean()
+    metrics = {
+        "total_amount": total_available,
+        "average_payment": float(df['Available Money'].mean()),
+        "min_payment": float(df['Available Money'].min()),
+        "max_payment": float(df['Available Money'].max()),
+        "completion_date": _text_or_none(df['Date'].iloc[-1]),
+        "total_months": len(df),
+        "total_income": float(df['Total Income'].sum()),
+        "total_expenses": float(df['Fixed Expenses'].sum()),
+        "average_savings_rate": float(average_savings_rate) if average_savings_rate == average_savings_rate else 0.0,
+        "trends": trends,
+        "monthly_stats": monthly_stats
+    }
+    
+    logger.info("Calculated metrics:")
+    for key, value in metrics.items():
+        if key not in ['trends', 'monthly_stats']:
+            logger.info(f"{key}: {value}")
+    
+    return metrics, schedule_df
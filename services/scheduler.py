@@ -1,6 +1,49 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import numpy as np
-from datetime import datetime, timedelta
+import pandas as pd
+
+HIGH_SEASON = 1
+LOW_SEASON = 0
+
+def _simulate(base_payment: float, remaining: float, month_numbers: np.ndarray,
+              high_mask: np.ndarray, low_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Numeric core of the schedule: seasonal payments capped at the remaining amount.
+    
+    Args:
+        base_payment: Payment for a month outside either season
+        remaining: Amount left to repay before the first payment
+        month_numbers: Calendar month (1-12) of each payment date
+        high_mask: Length-13 boolean array, True for high season months
+        low_mask: Length-13 boolean array, True for low season months
+        
+    Returns:
+        Tuple of payments, remaining balances and season codes, one per month paid
+    """
+    # 20% higher in high season, 20% lower in low season
+    multiplier = np.where(high_mask, 1.2, np.where(low_mask, 0.8, 1.0))
+    payments = base_payment * multiplier[month_numbers]
+    cumulative = np.cumsum(payments)
+    
+    # The first month whose cumulative payment covers the amount is the last one,
+    # and it only pays what is left
+    last = int(np.searchsorted(cumulative, remaining))
+    if last < len(payments):
+        payments[last] = remaining - (cumulative[last - 1] if last else 0.0)
+        payments = payments[:last + 1]
+        remainings = remaining - cumulative[:last + 1]
+        remainings[last] = 0.0
+    else:
+        remainings = remaining - cumulative
+    
+    season_codes = np.where(high_mask[month_numbers[:len(payments)]], HIGH_SEASON, LOW_SEASON)
+    return payments, remainings, season_codes
+
+def _season_mask(months: List[int]) -> np.ndarray:
+    """Boolean array indexed by month number (1-12), True for the given months"""
+    mask = np.zeros(13, dtype=np.bool_)
+    mask[[month for month in months if 1 <= month <= 12]] = True
+    return mask
 
 class RepaymentScheduler:
     def __init__(self, total_amount: float, term_months: int):
@@ -24,38 +67,30 @@ class RepaymentScheduler:
         # Calculate base monthly payment
         base_payment = self.total_amount / self.term_months
         
-        # Generate schedule
-        schedule = []
-        current_date = datetime.now()
-        remaining_amount = self.total_amount
+        # Payments fall on the first of each month, starting with the next one due
+        payment_dates = pd.date_range(start=pd.Timestamp.today().normalize(),
+                                      periods=self.term_months, freq='MS')
+        month_numbers = payment_dates.month.to_numpy()
         
-        for month in range(self.term_months):
-            payment_date = current_date + timedelta(days=30 * month)
-            month_number = payment_date.month
-            
-            # Adjust payment based on season
-            if month_number in high_season:
-                payment = base_payment * 1.2  # 20% higher in high season
-            elif month_number in low_season:
-                payment = base_payment * 0.8  # 20% lower in low season
-            else:
-                payment = base_payment
-            
-            # Ensure we don't exceed remaining amount
-            payment = min(payment, remaining_amount)
-            remaining_amount -= payment
-            
-            schedule.append({
-                'date': payment_date.strftime('%Y-%m-%d'),
-                'payment': round(payment, 2),
-                'remaining_balance': round(remaining_amount, 2),
-                'season': 'high' if month_number in high_season else 'low'
-            })
-            
-            if remaining_amount <= 0:
-                break
+        payments, remainings, season_codes = _simulate(
+            base_payment, float(self.total_amount), month_numbers,
+            _season_mask(high_season), _season_mask(low_season)
+        )
         
-        return schedule
+        return [
+            {
+                'date': date,
+                'payment': payment,
+                'remaining_balance': remaining,
+                'season': 'high' if code == HIGH_SEASON else 'low'
+            }
+            for date, payment, remaining, code in zip(
+                payment_dates[:len(payments)].strftime('%Y-%m-%d').tolist(),
+                np.round(payments, 2).tolist(),
+                np.round(remainings, 2).tolist(),
+                season_codes.tolist()
+            )
+        ]
     
     def calculate_metrics(self, schedule: List[Dict]) -> Dict:
         """
@@ -67,13 +102,14 @@ class RepaymentScheduler:
         Returns:
             Dictionary containing schedule metrics
         """
-        payments = [record['payment'] for record in schedule]
+        payments = np.fromiter((record['payment'] for record in schedule),
+                               dtype=np.float64, count=len(schedule))
         
         return {
-            'total_payments': sum(payments),
-            'average_payment': np.mean(payments),
-            'min_payment': min(payments),
-            'max_payment': max(payments),
+            'total_payments': float(payments.sum()),
+            'average_payment': float(payments.mean()),
+            'min_payment': float(payments.min()),
+            'max_payment': float(payments.max()),
             'completion_date': schedule[-1]['date'],
             'total_months': len(schedule)
         } 
\ No newline at end of file
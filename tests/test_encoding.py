@@ -0,0 +1,31 @@
+import codecs
+from services import encoding
+from services.encoding import detect_encoding
+
+HEADER = 'Month,Date,Total Income,Fixed Expenses\n'
+CYRILLIC_ROWS = 'Январь,2024-01-01,80000,30000\nФевраль,2024-02-01,82000,30000\n'
+
+def test_detect_encoding_bom():
+    assert detect_encoding(codecs.BOM_UTF8 + HEADER.encode('utf-8')) == 'utf-8-sig'
+
+def test_detect_encoding_ascii():
+    assert detect_encoding(HEADER.encode('ascii')) == 'utf-8'
+    assert detect_encoding(b'') == 'utf-8'
+
+def test_detect_encoding_utf8_cut_mid_character():
+    sample = (HEADER + CYRILLIC_ROWS).encode('utf-8')
+    cut = sample[:len(HEADER) + 1]  # First byte of the two-byte 'Я'
+    
+    assert detect_encoding(cut) == 'utf-8'
+
+def test_detect_encoding_cp1251_cyrillic():
+    assert detect_encoding((HEADER + CYRILLIC_ROWS).encode('cp1251')) == 'cp1251'
+
+def test_detect_encoding_chardet_confidence(monkeypatch):
+    sample = 'Month,Date\ncafé,2024-01-01\n'.encode('latin-1')
+    
+    monkeypatch.setattr(encoding.chardet, 'detect', lambda s: {'encoding': 'ISO-8859-1', 'confidence': 0.9})
+    assert detect_encoding(sample) == 'iso-8859-1'
+    
+    monkeypatch.setattr(encoding.chardet, 'detect', lambda s: {'encoding': 'ISO-8859-1', 'confidence': 0.1})
+    assert detect_encoding(sample) == 'cp1251'
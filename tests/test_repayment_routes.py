@@ -0,0 +1,112 @@
+import io
+import pytest
+import orjson
+from pyarrow import ipc
+from app import app
+import routes.repayment as repayment
+from services import schedule_builder
+
+BLANK_LABEL_CSV = b'Month,Date,Total Income,Fixed Expenses\nJan,2024-01-01,100,30\n,,200,10\n'
+
+@pytest.fixture
+def client():
+    repayment._schedule_cache.clear()
+    yield app.test_client()
+    repayment._schedule_cache.clear()
+
+def post_csv(client, raw, **kwargs):
+    return client.post('/generate-schedule', data={'file': (io.BytesIO(raw), 'income.csv')}, **kwargs)
+
+def test_blank_month_and_date_serialize_as_null(client):
+    response = post_csv(client, BLANK_LABEL_CSV)
+    
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['data'][1]['date'] is None
+    assert body['metrics']['completion_date'] is None
+    assert body['metrics']['monthly_stats']['savings_stats']['best_month'] is None
+    assert body['metrics']['monthly_stats']['savings_stats']['worst_month'] == 'Jan'
+
+def test_streamed_reduction_error_is_server_error(client, monkeypatch):
+    def broken_cleanup(df):
+        raise TypeError('reducer bug')
+    monkeypatch.setattr(schedule_builder, 'STREAMING_THRESHOLD', 0)
+    monkeypatch.setattr(schedule_builder, 'clean_currency_columns', broken_cleanup)
+    
+    response = post_csv(client, BLANK_LABEL_CSV)
+    
+    assert response.status_code == 500
+    assert response.get_json()['details'] == 'reducer bug'
+
+def income_csv(label):
+    return f'Month,Date,Total Income,Fixed Expenses\n{label},2024-01-01,100,30\n'.encode('utf-8')
+
+@pytest.fixture
+def compute_calls(monkeypatch):
+    calls = []
+    compute = repayment.compute_schedule
+    
+    def counting_compute(raw):
+        calls.append(raw)
+        return compute(raw)
+    monkeypatch.setattr(repayment, 'compute_schedule', counting_compute)
+    return calls
+
+def test_repeated_upload_is_served_from_cache(client, compute_calls):
+    first = post_csv(client, income_csv('Jan'))
+    second = post_csv(client, income_csv('Jan'))
+    
+    assert first.status_code == second.status_code == 200
+    assert first.get_json() == second.get_json()
+    assert len(compute_calls) == 1
+
+def test_cache_evicts_least_recently_used(client, compute_calls, monkeypatch):
+    monkeypatch.setattr(repayment, 'SCHEDULE_CACHE_SIZE', 2)
+    
+    post_csv(client, income_csv('Jan'))
+    post_csv(client, income_csv('Feb'))
+    post_csv(client, income_csv('Jan'))  # Hit; Feb is now the oldest entry
+    post_csv(client, income_csv('Mar'))  # Evicts Feb
+    assert len(repayment._schedule_cache) == 2
+    assert len(compute_calls) == 3
+    
+    post_csv(client, income_csv('Jan'))
+    assert len(compute_calls) == 3
+    post_csv(client, income_csv('Feb'))
+    assert len(compute_calls) == 4
+
+def test_input_errors_are_not_cached(client, compute_calls):
+    for _ in range(2):
+        response = post_csv(client, b'month,income\n2024-01,5\n')
+        assert response.status_code == 400
+    
+    assert len(compute_calls) == 2
+    assert len(repayment._schedule_cache) == 0
+
+def test_ndjson_response_streams_metrics_then_rows(client):
+    expected = post_csv(client, income_csv('Jan')).get_json()
+    response = post_csv(client, income_csv('Jan'), headers={'Accept': repayment.NDJSON_MIMETYPE})
+    
+    assert response.status_code == 200
+    assert response.mimetype == repayment.NDJSON_MIMETYPE
+    lines = [orjson.loads(line) for line in response.data.splitlines()]
+    assert lines[0] == {"metrics": expected["metrics"]}
+    assert lines[1:] == expected["data"]
+
+def test_arrow_response_carries_schedule_and_metrics(client):
+    expected = post_csv(client, income_csv('Jan')).get_json()
+    response = post_csv(client, income_csv('Jan'), headers={'Accept': repayment.ARROW_MIMETYPE})
+    
+    assert response.status_code == 200
+    assert response.mimetype == repayment.ARROW_MIMETYPE
+    table = ipc.open_stream(response.data).read_all()
+    assert orjson.loads(table.schema.metadata[b'metrics']) == expected["metrics"]
+    assert table.num_rows == len(expected["data"])
+    assert table.column_names == list(expected["data"][0])
+
+def test_wildcard_accept_defaults_to_json(client):
+    response = post_csv(client, income_csv('Jan'), headers={'Accept': '*/*'})
+    
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert set(response.get_json()) == {"metrics", "data"}
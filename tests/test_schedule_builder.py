@@ -0,0 +1,94 @@
+import io
+import pytest
+from services import schedule_builder
+from services.schedule_builder import read_income_csv
+
+def make_csv(rows):
+    lines = ['Month,Date,Total Income,Fixed Expenses'] + rows
+    return io.BytesIO(('\n'.join(lines) + '\n').encode('utf-8'))
+
+def test_read_income_csv_scientific_notation():
+    df = read_income_csv(make_csv([
+        'Jan,2024-01-01,1e3,1.5E+04',
+        'Feb,2024-02-01,2000,300'
+    ]))
+    
+    assert df['Total Income'].dtype == 'float64'
+    assert df['Total Income'].tolist() == [1000.0, 2000.0]
+    assert df['Fixed Expenses'].tolist() == [15000.0, 300.0]
+
+def test_read_income_csv_currency_symbols():
+    df = read_income_csv(make_csv([
+        'Jan,2024-01-01,"$1,200.50",1e3',
+        'Feb,2024-02-01,"$2,000",1.5E+04'
+    ]))
+    
+    assert df['Total Income'].tolist() == [1200.5, 2000.0]
+    assert df['Fixed Expenses'].tolist() == [1000.0, 15000.0]
+
+def test_streamed_blank_month_and_date_are_none(monkeypatch):
+    monkeypatch.setattr(schedule_builder, 'STREAMING_THRESHOLD', 0)
+    raw = make_csv(['Jan,2024-01-01,100,30', ',,200,10']).getvalue()
+    
+    metrics, schedule_df = schedule_builder.compute_schedule(raw)
+    
+    assert schedule_df is None
+    assert metrics['completion_date'] is None
+    assert metrics['monthly_stats']['savings_stats']['best_month'] is None
+    assert metrics['monthly_stats']['savings_stats']['worst_month'] == 'Jan'
+
+def flatten(metrics, prefix=''):
+    flat = {}
+    for key, value in metrics.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{prefix}{key}.'))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+def assert_streamed_matches_in_memory(monkeypatch, raw, chunk_size):
+    expected, schedule_df = schedule_builder.compute_schedule(raw)
+    assert schedule_df is not None
+    
+    monkeypatch.setattr(schedule_builder, 'STREAMING_THRESHOLD', 0)
+    monkeypatch.setattr(schedule_builder, 'CHUNK_SIZE', chunk_size)
+    streamed, schedule_df = schedule_builder.compute_schedule(raw)
+    assert schedule_df is None
+    
+    expected, streamed = flatten(expected), flatten(streamed)
+    assert expected.keys() == streamed.keys()
+    for key, value in expected.items():
+        if key.endswith('.median'):
+            assert streamed[key] is None
+        elif isinstance(value, float):
+            assert streamed[key] == pytest.approx(value), key
+        else:
+            assert streamed[key] == value, key
+
+def test_streamed_metrics_match_in_memory(monkeypatch):
+    rows = []
+    for i in range(50):
+        income = 0 if i % 13 == 5 else 1000 + (i * 37) % 500
+        expenses = 200 + (i * 53) % 300
+        rows.append(f'M{i},2024-{i % 12 + 1:02d}-01,"${income:,}",{expenses}')
+    
+    # Small chunks so state is carried across several chunk boundaries
+    assert_streamed_matches_in_memory(monkeypatch, make_csv(rows).getvalue(), chunk_size=7)
+
+@pytest.mark.parametrize('expenses', [(30, -40), (30, 40), (0, 0)])
+def test_streamed_metrics_match_in_memory_with_zero_income(monkeypatch, expenses):
+    rows = [f'M{i},2024-{i + 1:02d}-01,0,{amount}' for i, amount in enumerate(expenses)]
+    assert_streamed_matches_in_memory(monkeypatch, make_csv(rows).getvalue(), chunk_size=1)
+
+def test_streamed_missing_columns_is_input_error(monkeypatch):
+    monkeypatch.setattr(schedule_builder, 'STREAMING_THRESHOLD', 0)
+    
+    with pytest.raises(schedule_builder.ScheduleInputError, match='Missing required columns'):
+        schedule_builder.compute_schedule(b'month,income\n2024-01,5\n')
+
+@pytest.mark.parametrize('threshold', [schedule_builder.STREAMING_THRESHOLD, 0])
+def test_header_only_csv_is_input_error(monkeypatch, threshold):
+    monkeypatch.setattr(schedule_builder, 'STREAMING_THRESHOLD', threshold)
+    
+    with pytest.raises(schedule_builder.ScheduleInputError, match='no data rows'):
+        schedule_builder.compute_schedule(make_csv([]).getvalue())
@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime
-from ..services.scheduler import RepaymentScheduler
+from services.scheduler import RepaymentScheduler
 
 def test_scheduler_initialization():
     scheduler = RepaymentScheduler(total_amount=10000, term_months=12)
@@ -43,4 +43,23 @@ def test_calculate_metrics():
     assert metrics['min_payment'] == 800
     assert metrics['max_payment'] == 1200
     assert metrics['completion_date'] == '2023-03-01'
-    assert metrics['total_months'] == 3 
\ No newline at end of file
+    assert metrics['total_months'] == 3 
+
+def test_generate_schedule_monthly_dates():
+    scheduler = RepaymentScheduler(total_amount=6000, term_months=6)
+    income_pattern = {
+        'monthly_averages': {},
+        'high_season_months': [],
+        'low_season_months': []
+    }
+    
+    schedule = scheduler.generate_schedule(income_pattern)
+    dates = [datetime.strptime(record['date'], '%Y-%m-%d') for record in schedule]
+    
+    # One payment on the first of each consecutive calendar month
+    assert all(date.day == 1 for date in dates)
+    assert all(
+        (later.year * 12 + later.month) - (earlier.year * 12 + earlier.month) == 1
+        for earlier, later in zip(dates, dates[1:])
+    )
+    assert dates[0] >= datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)